@@ -8,8 +8,12 @@ from ijson import common, utils
 import codecs
 
 
-LEXEME_RE = re.compile(r'[a-z0-9eE\.\+-]+|\S')
+# Strings fully contained in the buffer are matched as a single lexeme so the
+# regex engine scans for their closing quote; anything else starting with '"'
+# (i.e., strings split across buffers) matches as a lone '"'
+LEXEME_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[a-z0-9eE\.\+-]+|\S')
 UNARY_LEXEMES = set('[]{},')
+# Sent by the Lexer once input is exhausted; no other lexeme has a None symbol
 EOF = -1, None
 
 
@@ -62,8 +66,9 @@ def Lexer(target):
     pos = 0
     discarded = 0
     send = target.send
+    search = LEXEME_RE.search
     while True:
-        match = LEXEME_RE.search(buf, pos)
+        match = search(buf, pos)
         if match:
             lexeme = match.group()
             if lexeme == '"':
@@ -89,6 +94,9 @@ def Lexer(target):
                         buf += data
                 send((discarded + pos, buf[pos:end + 1]))
                 pos = end + 1
+            elif lexeme[0] == '"':
+                send((discarded + match.start(), lexeme))
+                pos = match.end()
             else:
                 while lexeme not in UNARY_LEXEMES and match.end() == len(buf):
                     try:
@@ -98,7 +106,7 @@ def Lexer(target):
                     if not data:
                         break
                     buf += data
-                    match = LEXEME_RE.search(buf, pos)
+                    match = search(buf, pos)
                     lexeme = match.group()
                 send((discarded + match.start(), lexeme))
                 pos = match.end()
@@ -131,6 +139,11 @@ _PARSE_OBJECT_END = 3
 # infinity singleton for overflow checks
 inf = float("inf")
 
+# Integers up to this many digits (i.e., all 64-bit ones) take a fast path;
+# longer ones go through the general number handling, where errors from int()
+# (e.g., due to sys.set_int_max_str_digits) are reported as JSON errors
+_MAX_FAST_INT_DIGITS = 18
+
 @utils.coroutine
 def parse_value(target, multivalue, use_float):
     """
@@ -156,7 +169,7 @@ def parse_value(target, multivalue, use_float):
 
         if prev_pos is None:
             pos, symbol = (yield)
-            if (pos, symbol) == EOF:
+            if symbol is None:
                 if state_stack:
                     raise common.IncompleteJSONError('Incomplete JSON content')
                 break
@@ -191,7 +204,7 @@ def parse_value(target, multivalue, use_float):
             elif symbol == '[':
                 send(('start_array', None))
                 pos, symbol = (yield)
-                if (pos, symbol) == EOF:
+                if symbol is None:
                     raise common.IncompleteJSONError('Incomplete JSON content')
                 if symbol == ']':
                     send(('end_array', None))
@@ -204,7 +217,7 @@ def parse_value(target, multivalue, use_float):
             elif symbol == '{':
                 send(('start_map', None))
                 pos, symbol = (yield)
-                if (pos, symbol) == EOF:
+                if symbol is None:
                     raise common.IncompleteJSONError('Incomplete JSON content')
                 if symbol == '}':
                     send(('end_map', None))
@@ -212,8 +225,19 @@ def parse_value(target, multivalue, use_float):
                 else:
                     prev_pos, prev_symbol = pos, symbol
                     push(_PARSE_OBJECT_KEY)
-            # A number
+            # Short, plain non-negative integers, no further validation needed.
+            # Lexemes longer than one character are always ASCII (see
+            # LEXEME_RE), so checking the first one rules out Unicode digits
+            elif (('1' <= symbol[0] <= '9' and symbol.isdigit() and
+                   len(symbol) <= _MAX_FAST_INT_DIGITS) or symbol == '0'):
+                send(('number', int(symbol)))
+                pop()
+            # Any other number
             else:
+                # int() and Decimal() accept non-ASCII digits, JSON doesn't.
+                # Non-ASCII lexemes are single characters (see LEXEME_RE)
+                if symbol[0] > '\x7f':
+                    raise UnexpectedSymbol(symbol, pos)
                 # JSON numbers can't contain leading zeros
                 if ((len(symbol) > 1 and symbol[0] == '0' and symbol[1] not in ('e', 'E', '.')) or
                     (len(symbol) > 2 and symbol[0:2] == '-0' and symbol[2] not in ('e', 'E', '.'))):
@@ -223,22 +247,21 @@ def parse_value(target, multivalue, use_float):
                     raise common.JSONError('Invalid JSON number: %s' % (symbol,))
                 try:
                     number = to_number(symbol)
-                    if number == inf:
-                        raise common.JSONError("float overflow: %s" % (symbol,))
                 except:
                     if 'true'.startswith(symbol) or 'false'.startswith(symbol) or 'null'.startswith(symbol):
                         raise common.IncompleteJSONError('Incomplete JSON content')
                     raise UnexpectedSymbol(symbol, pos)
-                else:
-                    send(('number', number))
-                    pop()
+                if use_float and number == inf:
+                    raise common.JSONError("float overflow: %s" % (symbol,))
+                send(('number', number))
+                pop()
 
         elif state == _PARSE_OBJECT_KEY:
             if symbol[0] != '"':
                 raise UnexpectedSymbol(symbol, pos)
             send(('map_key', parse_string(symbol)))
             pos, symbol = (yield)
-            if (pos, symbol) == EOF:
+            if symbol is None:
                 raise common.IncompleteJSONError('Incomplete JSON content')
             if symbol != ':':
                 raise UnexpectedSymbol(symbol, pos)
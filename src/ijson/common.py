@@ -68,27 +68,36 @@ def parse_basecoro(target):
       ('', 'end_map', None)
 
     '''
-    path = []
+    # Prefixes are built incrementally rather than joining the full path on
+    # every event: ``containers`` holds the prefix of each open container, and
+    # ``value_prefix`` the prefix of the next value to be found. Only top-level
+    # containers have no leading component in their children's prefixes.
+    containers = []
+    value_prefix = ''
+    send = target.send
     while True:
         event, value = yield
         if event == 'map_key':
-            prefix = '.'.join(path[:-1])
-            path[-1] = value
+            prefix = containers[-1]
+            if len(containers) > 1:
+                value_prefix = prefix + '.' + value
+            else:
+                value_prefix = value
         elif event == 'start_map':
-            prefix = '.'.join(path)
-            path.append(None)
-        elif event == 'end_map':
-            path.pop()
-            prefix = '.'.join(path)
+            prefix = value_prefix
+            containers.append(prefix)
         elif event == 'start_array':
-            prefix = '.'.join(path)
-            path.append('item')
-        elif event == 'end_array':
-            path.pop()
-            prefix = '.'.join(path)
+            prefix = value_prefix
+            containers.append(prefix)
+            if len(containers) > 1:
+                value_prefix = prefix + '.item'
+            else:
+                value_prefix = 'item'
+        elif event == 'end_map' or event == 'end_array':
+            prefix = value_prefix = containers.pop()
         else: # any scalar value
-            prefix = '.'.join(path)
-        target.send((prefix, event, value))
+            prefix = value_prefix
+        send((prefix, event, value))
 
 
 class ObjectBuilder:
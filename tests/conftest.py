@@ -6,17 +6,23 @@ import ijson
 import pytest
 
 
-def _get_available_backends():
+def _get_backends():
+    """
+    Imports all backends once, returning (name, backend, error) tuples.
+    Backends that cannot be imported are given as None, together with the
+    ImportError that prevented it, so tests against them are reported as
+    skipped rather than silently dropped.
+    """
     backends = []
-    for backend in ijson.ALL_BACKENDS:
+    for name in ijson.ALL_BACKENDS:
         try:
-            backends.append(ijson.get_backend(backend))
-        except ImportError:
-            pass
+            backends.append((name, ijson.get_backend(name), None))
+        except ImportError as e:
+            backends.append((name, None, e))
     return backends
 
 
-_available_backends = _get_available_backends()
+_backends = _get_backends()
 
 
 class InputType(enum.Enum):
@@ -37,10 +43,6 @@ class BackendAdaptor:
         self._suffix = suffix
         self._get_all = get_all
 
-    @property
-    def pytest_parameter_id(self):
-        return f"{self.backend.backend_name}-{self._input_type.name.lower()}"
-
     def __getattr__(self, name):
         routine = getattr(self.backend, name + self._suffix)
         def get_all_for_name(*args, **kwargs):
@@ -53,25 +55,41 @@ from .support.async_types_coroutines import get_all as get_all_async_types_corou
 from .support.coroutines import get_all as get_all_coro
 from .support.generators import get_all as get_all_gen
 
-_pull_backend_adaptors = [
-    backend_adaptor
-    for backend in _available_backends
-    for backend_adaptor in [
-        BackendAdaptor(backend, InputType.ASYNC_FILE, "_async", get_all_async),
-        BackendAdaptor(backend, InputType.ASYNC_TYPES_COROUTINES_FILE, "_async", get_all_async_types_coroutines),
-        BackendAdaptor(backend, InputType.FILE, "_gen", get_all_gen),
-    ]
+_pull_input_types = [
+    (InputType.ASYNC_FILE, "_async", get_all_async),
+    (InputType.ASYNC_TYPES_COROUTINES_FILE, "_async", get_all_async_types_coroutines),
+    (InputType.FILE, "_gen", get_all_gen),
 ]
 
-_push_backend_adaptors = [
-    backend_adaptor
-    for backend in _available_backends
-    for backend_adaptor in [
-        BackendAdaptor(backend, InputType.SENDABLE, "_coro", get_all_coro),
-    ]
+_push_input_types = [
+    (InputType.SENDABLE, "_coro", get_all_coro),
 ]
 
-_all_backend_adaptors = _pull_backend_adaptors + _push_backend_adaptors
+
+def _param(value, id, error):
+    marks = ()
+    if error is not None:
+        marks = pytest.mark.skip(reason=f"backend not available: {error}")
+    return pytest.param(value, id=id, marks=marks)
+
+
+_backend_params = [_param(backend, name, error) for name, backend, error in _backends]
+
+
+def _adaptor_params(input_types):
+    return [
+        _param(
+            BackendAdaptor(backend, input_type, suffix, get_all) if backend else None,
+            f"{name}-{input_type.name.lower()}",
+            error
+        )
+        for name, backend, error in _backends
+        for input_type, suffix, get_all in input_types
+    ]
+
+
+_pull_adaptor_params = _adaptor_params(_pull_input_types)
+_all_adaptor_params = _pull_adaptor_params + _adaptor_params(_push_input_types)
 
 BACKEND_PARAM_NAME = "backend"
 ADAPTOR_PARAM_NAME = "adaptor"
@@ -81,22 +99,12 @@ def pytest_generate_tests(metafunc):
     requires_adaptor = ADAPTOR_PARAM_NAME in metafunc.fixturenames
     assert not (requires_backend and requires_adaptor)
 
-    names = []
-
-    # if both are required we need to match backend and adaptors correctly
     if requires_backend:
-        names = BACKEND_PARAM_NAME
-        values = _available_backends
-        ids = [backend.backend_name for backend in _available_backends]
+        metafunc.parametrize(BACKEND_PARAM_NAME, _backend_params)
     elif requires_adaptor:
         pull_only = bool(list(metafunc.definition.iter_markers('pull_only')))
-        adaptors = _pull_backend_adaptors if pull_only else _all_backend_adaptors
-        names = ADAPTOR_PARAM_NAME
-        values = adaptors
-        ids = [adaptor.pytest_parameter_id for adaptor in adaptors]
-
-    if names:
-        metafunc.parametrize(names, values, ids=ids)
+        adaptor_params = _pull_adaptor_params if pull_only else _all_adaptor_params
+        metafunc.parametrize(ADAPTOR_PARAM_NAME, adaptor_params)
 
 def pytest_addoption(parser):
     group = parser.getgroup("Memory leak tests")
@@ -32,6 +32,7 @@ JSON = b'''
   ]
 }
 '''
+JSON_STR = JSON.decode('utf-8')
 JSON_OBJECT = {
     "docs": [
         {
@@ -61,7 +62,7 @@ JSON_OBJECT = {
         }
     ]
 }
-JSON_PARSE_EVENTS = [
+JSON_PARSE_EVENTS = (
     ('', 'start_map', None),
     ('', 'map_key', 'docs'),
     ('docs', 'start_array', None),
@@ -113,90 +114,28 @@ JSON_PARSE_EVENTS = [
     ('docs.item', 'end_map', None),
     ('docs', 'end_array', None),
     ('', 'end_map', None)
-]
-JSON_KVITEMS = [
-    ("null", None),
-    ("boolean", False),
-    ("true", True),
-    ("integer", 0),
-    ("double", Decimal("0.5")),
-    ("exponent", 1e+2),
-    ("long", 10000000000),
-    ("string", "строка - тест"),
-    ("ñandú", None),
-    ("meta", [[1], {}]),
-    ("meta", {"key": "value"}),
-    ("meta", None),
-    ("meta", [])
-]
+)
+# key/value pairs of the objects under docs.item
+JSON_KVITEMS = tuple(
+    (key, value) for doc in JSON_OBJECT["docs"] for key, value in doc.items()
+)
 JSON_KVITEMS_META = [
     ('key', 'value')
 ]
-JSON_EVENTS = [
-    ('start_map', None),
-        ('map_key', 'docs'),
-        ('start_array', None),
-            ('start_map', None),
-                ('map_key', 'null'),
-                ('null', None),
-                ('map_key', 'boolean'),
-                ('boolean', False),
-                ('map_key', 'true'),
-                ('boolean', True),
-                ('map_key', 'integer'),
-                ('number', 0),
-                ('map_key', 'double'),
-                ('number', Decimal('0.5')),
-                ('map_key', 'exponent'),
-                ('number', 100),
-                ('map_key', 'long'),
-                ('number', 10000000000),
-                ('map_key', 'string'),
-                ('string', 'строка - тест'),
-                ('map_key', 'ñandú'),
-                ('null', None),
-            ('end_map', None),
-            ('start_map', None),
-                ('map_key', 'meta'),
-                ('start_array', None),
-                    ('start_array', None),
-                        ('number', 1),
-                    ('end_array', None),
-                    ('start_map', None),
-                    ('end_map', None),
-                ('end_array', None),
-            ('end_map', None),
-            ('start_map', None),
-                ('map_key', 'meta'),
-                ('start_map', None),
-                    ('map_key', 'key'),
-                    ('string', 'value'),
-                ('end_map', None),
-            ('end_map', None),
-            ('start_map', None),
-                ('map_key', 'meta'),
-                ('null', None),
-            ('end_map', None),
-            ('start_map', None),
-                ('map_key', 'meta'),
-                ('start_array', None),
-                ('end_array', None),
-            ('end_map', None),
-        ('end_array', None),
-    ('end_map', None),
-]
+# Same as JSON_PARSE_EVENTS, without the prefixes
+JSON_EVENTS = tuple((event, value) for _, event, value in JSON_PARSE_EVENTS)
 
 # Like JSON, but with an additional top-level array structure
 ARRAY_JSON = b'[' + JSON + b']'
 ARRAY_JSON_EVENTS = (
-    [('start_array', None)] +
+    (('start_array', None),) +
     JSON_EVENTS +
-    [('end_array', None)]
+    (('end_array', None),)
 )
 ARRAY_JSON_PARSE_EVENTS = (
-    [('', 'start_array', None)] +
-    [('.'.join(filter(None, ('item', p))), t, e) for p, t, e in JSON_PARSE_EVENTS] +
-    [('', 'end_array', None)]
+    (('', 'start_array', None),) +
+    tuple(('.'.join(filter(None, ('item', p))), t, e) for p, t, e in JSON_PARSE_EVENTS) +
+    (('', 'end_array', None),)
 )
 ARRAY_JSON_OBJECT = [JSON_OBJECT]
 
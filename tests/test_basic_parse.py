@@ -1,17 +1,18 @@
 """Tests for the ijson.basic_parse method"""
 
 import itertools
+import sys
 import threading
 from decimal import Decimal
 
 import pytest
 from ijson import common
 
-from .test_base import ARRAY_JSON, ARRAY_JSON_EVENTS, INCOMPLETE_JSONS, INCOMPLETE_JSON_TOKENS, INVALID_JSONS, JSON, JSON_EVENTS, SCALAR_JSON, SURROGATE_PAIRS_JSON, STRINGS_JSON
+from .test_base import ARRAY_JSON, ARRAY_JSON_EVENTS, INCOMPLETE_JSONS, INCOMPLETE_JSON_TOKENS, INVALID_JSONS, INVALID_JSON_WITH_DANGLING_JUNK, JSON, JSON_EVENTS, SCALAR_JSON, SURROGATE_PAIRS_JSON, STRINGS_JSON
 
 
-def _raises_json_error(adaptor, json, **kwargs):
-    with pytest.raises(common.JSONError):
+def _raises_json_error(adaptor, json, match=None, **kwargs):
+    with pytest.raises(common.JSONError, match=match):
         adaptor.basic_parse(json, **kwargs)
 
 
@@ -21,7 +22,7 @@ def _raises_incomplete_json_error(adaptor, json):
 
 
 def test_basic_parse(adaptor):
-    assert JSON_EVENTS == adaptor.basic_parse(JSON)
+    assert JSON_EVENTS == tuple(adaptor.basic_parse(JSON))
 
 
 def test_basic_parse_threaded(adaptor):
@@ -31,7 +32,7 @@ def test_basic_parse_threaded(adaptor):
 
 
 def test_basic_parse_array(adaptor):
-    assert ARRAY_JSON_EVENTS == adaptor.basic_parse(ARRAY_JSON)
+    assert ARRAY_JSON_EVENTS == tuple(adaptor.basic_parse(ARRAY_JSON))
 
 
 def test_basic_parse_array_threaded(adaptor):
@@ -98,6 +99,38 @@ def test_max_double(adaptor):
     _raises_json_error(adaptor, b'1e400', use_float=True)
 
 
+def test_float_overflow_message(adaptor):
+    """Check that the python backend reports float overflows as such"""
+    if adaptor.backend.backend_name != 'python':
+        return
+    _raises_json_error(adaptor, b'[1e400]', match='float overflow', use_float=True)
+
+
+@pytest.mark.parametrize("json", (b'[\xc2\xb2]', b'[\xd9\xa1]', b'[1\xc2\xb2]'))
+def test_non_ascii_digits(adaptor, json):
+    """Unicode digits other than 0-9 are not valid JSON numbers"""
+    _raises_json_error(adaptor, json)
+
+
+@pytest.mark.parametrize("json", (b'1' * 5000, b'[' + b'1' * 5000 + b']', b'-' + b'1' * 5000))
+def test_huge_integers(adaptor, json):
+    """Check that the python backend reports int()'s digit limit as a JSON error"""
+    if adaptor.backend.backend_name != 'python':
+        return
+    max_digits = getattr(sys, 'get_int_max_str_digits', lambda: 0)()
+    if not 0 < max_digits < 5000:
+        pytest.skip("int() has no digit limit below 5000")
+    _raises_json_error(adaptor, json)
+
+
+@pytest.mark.parametrize("json", (b'[01]', b'[00]', b'[-01]'))
+def test_integers_with_leading_zeros(adaptor, json):
+    """Leading zeros are invalid for plain integers inside containers too"""
+    if not adaptor.backend.capabilities.invalid_leading_zeros_detection:
+        return
+    _raises_json_error(adaptor, json)
+
+
 @pytest.mark.parametrize(
     "json", [
         sign + prefix + suffix
@@ -127,23 +160,23 @@ def test_incomplete_fractions(adaptor, json):
     _raises_json_error(adaptor, json)
 
 
-def test_incomplete(adaptor):
-    for json in INCOMPLETE_JSONS:
-        _raises_incomplete_json_error(adaptor, json)
+@pytest.mark.parametrize("json", INCOMPLETE_JSONS)
+def test_incomplete(adaptor, json):
+    _raises_incomplete_json_error(adaptor, json)
 
 
-def test_incomplete_tokens(adaptor):
+@pytest.mark.parametrize("json", INCOMPLETE_JSON_TOKENS)
+def test_incomplete_tokens(adaptor, json):
     if not adaptor.backend.capabilities.incomplete_json_tokens_detection:
         return
-    for json in INCOMPLETE_JSON_TOKENS:
-        _raises_incomplete_json_error(adaptor, json)
+    _raises_incomplete_json_error(adaptor, json)
 
 
-def test_invalid(adaptor):
-    for json in INVALID_JSONS:
-        if not adaptor.backend.capabilities.incomplete_json_tokens_detection and json == INVALID_JSON_WITH_DANGLING_JUNK:
-            continue
-        _raises_json_error(adaptor, json)
+@pytest.mark.parametrize("json", INVALID_JSONS)
+def test_invalid(adaptor, json):
+    if not adaptor.backend.capabilities.incomplete_json_tokens_detection and json == INVALID_JSON_WITH_DANGLING_JUNK:
+        return
+    _raises_json_error(adaptor, json)
 
 
 def test_comments(adaptor):
@@ -171,4 +204,4 @@ def test_multiple_values(adaptor):
     with pytest.raises(common.JSONError):
         adaptor.basic_parse(multiple_json, multiple_values=False)
     result = adaptor.basic_parse(multiple_json, multiple_values=True)
-    assert JSON_EVENTS + JSON_EVENTS + JSON_EVENTS == result
+    assert JSON_EVENTS + JSON_EVENTS + JSON_EVENTS == tuple(result)
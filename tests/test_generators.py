@@ -1,3 +1,4 @@
+import collections
 import io
 
 import pytest
@@ -10,23 +11,25 @@ from .test_base import JSON,  JSON_EVENTS, PARTIAL_ARRAY_JSONS, INVALID_JSONS
 class SingleReadFile:
     '''A bytes file that can be read only once'''
 
+    _EMPTY = bytes()
+
     def __init__(self, raw_value):
         self.raw_value = raw_value
 
     def read(self, size=-1):
         if size == 0:
-            return bytes()
+            return self._EMPTY
         val = self.raw_value
-        if not val:
+        if val is self._EMPTY:
             raise AssertionError('read twice')
-        self.raw_value = bytes()
+        self.raw_value = self._EMPTY
         return val
 
 
 def test_utf8_split(backend):
     buf_size = JSON.index(b'\xd1') + 1
     try:
-        list(backend.basic_parse_gen(io.BytesIO(JSON), buf_size=buf_size))
+        collections.deque(backend.basic_parse_gen(io.BytesIO(JSON), buf_size=buf_size), maxlen=0)
     except UnicodeDecodeError:
         pytest.fail('UnicodeDecodeError raised')
 
@@ -41,30 +44,31 @@ def test_extra_content_still_generates_results(backend):
         events = []
         for event in backend.basic_parse(JSON + b"#"):
             events.append(event)
-    assert events == JSON_EVENTS
+    assert tuple(events) == JSON_EVENTS
 
 def test_boundary_lexeme(backend):
     buf_size = JSON.index(b'false') + 1
     events = list(backend.basic_parse(JSON, buf_size=buf_size))
-    assert events == JSON_EVENTS
+    assert tuple(events) == JSON_EVENTS
 
 def test_boundary_whitespace(backend):
     buf_size = JSON.index(b'   ') + 1
     events = list(backend.basic_parse_gen(io.BytesIO(JSON), buf_size=buf_size))
-    assert events == JSON_EVENTS
+    assert tuple(events) == JSON_EVENTS
 
-def test_item_building_greediness(backend):
-    _test_item_iteration_validity(backend, io.BytesIO)
+@pytest.mark.parametrize("partial_array_json", PARTIAL_ARRAY_JSONS)
+def test_item_building_greediness(backend, partial_array_json):
+    _test_item_iteration_validity(backend, io.BytesIO, partial_array_json)
 
-def test_lazy_file_reading(backend):
-    _test_item_iteration_validity(backend, SingleReadFile)
+@pytest.mark.parametrize("partial_array_json", PARTIAL_ARRAY_JSONS)
+def test_lazy_file_reading(backend, partial_array_json):
+    _test_item_iteration_validity(backend, SingleReadFile, partial_array_json)
 
-def _test_item_iteration_validity(backend, file_type):
-    for json in PARTIAL_ARRAY_JSONS:
-        json, expected_items = json[0], json[1:]
-        iterable = backend.items_gen(file_type(json), 'item')
-        for expected_item in expected_items:
-            assert expected_item == next(iterable)
+def _test_item_iteration_validity(backend, file_type, partial_array_json):
+    json, expected_items = partial_array_json[0], partial_array_json[1:]
+    iterable = backend.items_gen(file_type(json), 'item')
+    for expected_item in expected_items:
+        assert expected_item == next(iterable)
 
 
 COMMON_DATA = b'''
@@ -6,7 +6,7 @@ import pytest
 
 
 def test_kvitems(adaptor):
-    assert JSON_KVITEMS == adaptor.kvitems(JSON, 'docs.item')
+    assert JSON_KVITEMS == tuple(adaptor.kvitems(JSON, 'docs.item'))
 
 
 def test_kvitems_toplevel(adaptor):
@@ -35,7 +35,7 @@ def test_kvitems_different_underlying_types(adaptor):
 
 
 def test_kvitems_array(adaptor):
-    assert JSON_KVITEMS == adaptor.kvitems(ARRAY_JSON, 'item.docs.item')
+    assert JSON_KVITEMS == tuple(adaptor.kvitems(ARRAY_JSON, 'item.docs.item'))
 
 
 @pytest.mark.parametrize("test_case", [
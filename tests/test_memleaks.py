@@ -1,6 +1,8 @@
-import ijson
+import collections
 import io
 
+import ijson
+
 import pytest
 
 
@@ -11,7 +13,7 @@ def _memusage():
 
 
 def _exhaust(it):
-    sum(1 for _ in it)
+    collections.deque(it, maxlen=0)
 
 
 def _repeat(n, f, *args, exhaust=False, **kwargs):
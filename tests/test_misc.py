@@ -6,7 +6,7 @@ import pytest
 from ijson import common
 
 from tests.test_base import JSON, JSON_EVENTS, JSON_PARSE_EVENTS, JSON_OBJECT,\
-    JSON_KVITEMS
+    JSON_KVITEMS, JSON_STR
 
 
 class TestMisc:
@@ -32,25 +32,26 @@ class TestMainEntryPoints:
             routine(lambda _: JSON, *args, **kwargs)
 
     def _assert_bytes(self, expected_results, routine, *args, **kwargs):
-        results = list(routine(JSON, *args, **kwargs))
+        results = tuple(routine(JSON, *args, **kwargs))
         assert expected_results == results
 
     def _assert_str(self, expected_results, routine, *args, **kwargs):
         with pytest.deprecated_call():
-            results = list(routine(JSON.decode("utf-8"), *args, **kwargs))
+            results = tuple(routine(JSON_STR, *args, **kwargs))
+        assert expected_results == results
 
     def _assert_file(self, expected_results, routine, *args, **kwargs):
-        results = list(routine(io.BytesIO(JSON), *args, **kwargs))
+        results = tuple(routine(io.BytesIO(JSON), *args, **kwargs))
         assert expected_results == results
 
     def _assert_async_file(self, expected_results, routine, *args, **kwargs):
         from .support.async_ import get_all
-        results = get_all(routine, JSON, *args, **kwargs)
-        expected_results == results
+        results = tuple(get_all(routine, JSON, *args, **kwargs))
+        assert expected_results == results
 
     def _assert_async_types_coroutine(self, expected_results, routine, *args, **kwargs):
         from .support.async_types_coroutines import get_all
-        results = get_all(routine, JSON, *args, **kwargs)
+        results = tuple(get_all(routine, JSON, *args, **kwargs))
         assert expected_results == results
 
     def _assert_events(self, expected_results, previous_routine, routine, *args, **kwargs):
@@ -60,7 +61,7 @@ class TestMainEntryPoints:
         def event_yielder():
             for evt in events:
                 yield evt
-        results = list(routine(event_yielder(), *args, **kwargs))
+        results = tuple(routine(event_yielder(), *args, **kwargs))
         assert expected_results == results
 
     def _assert_entry_point(self, expected_results, previous_routine, routine,
@@ -81,7 +82,7 @@ class TestMainEntryPoints:
         self._assert_entry_point(JSON_PARSE_EVENTS, backend.basic_parse, backend.parse)
 
     def test_rich_items(self, backend):
-        self._assert_entry_point([JSON_OBJECT], backend.parse, backend.items, '')
+        self._assert_entry_point((JSON_OBJECT,), backend.parse, backend.items, '')
 
     def test_rich_kvitems(self, backend):
         self._assert_entry_point(JSON_KVITEMS, backend.parse, backend.kvitems, 'docs.item')
\ No newline at end of file
@@ -3,7 +3,7 @@
 from .test_base import ARRAY_JSON, ARRAY_JSON_PARSE_EVENTS, JSON, JSON_PARSE_EVENTS
 
 def test_parse(adaptor):
-    assert JSON_PARSE_EVENTS == adaptor.parse(JSON)
+    assert JSON_PARSE_EVENTS == tuple(adaptor.parse(JSON))
 
 def test_parse_array(adaptor):
-    assert ARRAY_JSON_PARSE_EVENTS == adaptor.parse(ARRAY_JSON)
+    assert ARRAY_JSON_PARSE_EVENTS == tuple(adaptor.parse(ARRAY_JSON))
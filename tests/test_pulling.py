@@ -1,16 +1,26 @@
 import pytest
 
-from .test_base import JSON, JSON_EVENTS
+from .test_base import JSON, JSON_EVENTS, JSON_STR, STRINGS_JSON
 
 
 @pytest.mark.pull_only
 def test_string_stream(adaptor):
-    with pytest.deprecated_call():
-        events = adaptor.basic_parse(JSON.decode('utf-8'))
-    assert JSON_EVENTS == events
+    with pytest.warns(DeprecationWarning, match='a string reader has been given'):
+        events = adaptor.basic_parse(JSON_STR)
+    assert JSON_EVENTS == tuple(events)
 
 
 @pytest.mark.pull_only
 @pytest.mark.parametrize("buf_size", (2 ** exp for exp in range(0, 13, 2)))
 def test_different_buf_sizes(adaptor, buf_size):
-    assert JSON_EVENTS == adaptor.basic_parse(JSON, buf_size=buf_size)
+    assert JSON_EVENTS == tuple(adaptor.basic_parse(JSON, buf_size=buf_size))
+
+
+@pytest.mark.pull_only
+@pytest.mark.parametrize("buf_size", range(1, len(STRINGS_JSON) + 1))
+def test_strings_different_buf_sizes(adaptor, buf_size):
+    """Strings split across reads, including inside escape sequences"""
+    events = adaptor.basic_parse(STRINGS_JSON, buf_size=buf_size)
+    strings = [value for event, value in events if event == 'string']
+    assert ['', '"', '\\', '\\\\', '\b\f\n\r\t'] == strings
+    assert ('map_key', 'special\t') in events